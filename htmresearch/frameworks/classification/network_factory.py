@@ -23,9 +23,8 @@
 The methods here are a factory to create a classification network
 of any of sensor, SP, TM, TP, and classifier regions.
 """
-import simplejson
+import json
 import logging
-import sys
 
 from nupic.encoders import MultiEncoder
 from nupic.engine import Network
@@ -33,10 +32,16 @@ from nupic.engine import pyRegions
 
 from htmresearch.support.register_regions import registerResearchRegion
 
-_PY_REGIONS = [r[1] for r in pyRegions]
+_PY_REGIONS = frozenset(r[1] for r in pyRegions)
+# (configKey, optional) for the regions whose learning mode can be toggled,
+# in the order they are returned by setRegionLearning.
+_LEARNING_REGION_CONFIGS = (
+  ("spRegionConfig", True),
+  ("tmRegionConfig", True),
+  ("tpRegionConfig", True),
+  ("classifierRegionConfig", False),
+)
 _LOGGER = logging.getLogger(__name__)
-logging.basicConfig(format='[%(levelname)s] %(message)s', level=logging.DEBUG,
-                    stream=sys.stdout)
 
 
 
@@ -70,20 +75,6 @@ def _createEncoder(encoders):
 
 
 
-def _getEncoderParam(networkConfig, encoderName, paramName):
-  """
-  Get the value of an encoder parameter for the sensor region.
-
-  @param networkConfig: (dict) the configuration of the network
-  @param encoderName: (str) name of the encoder. E.g. 'ScalarEncoder'.
-  @param paramName: (str) name of the param to update. E.g. 'minval'.
-  @return paramValue: None if key 'paramName' does not exist. Value otherwise.
-  """
-  return networkConfig["sensorRegionConfig"]["encoders"][encoderName].get(
-    paramName)
-
-
-
 def _setScalarEncoderMinMax(networkConfig, dataSource):
   """
   Set the min and max values of a scalar encoder.
@@ -91,15 +82,11 @@ def _setScalarEncoderMinMax(networkConfig, dataSource):
   @param networkConfig: (dict) configuration of the network.
   @param dataSource: (RecordStream) the input source
   """
-  fieldName = _getEncoderParam(networkConfig, "scalarEncoder", "fieldname")
-  minval = dataSource.getFieldMin(fieldName)
-  maxval = dataSource.getFieldMax(fieldName)
-  networkConfig["sensorRegionConfig"]["encoders"]["scalarEncoder"][
-    "minval"] = (
-    minval)
-  networkConfig["sensorRegionConfig"]["encoders"]["scalarEncoder"][
-    "maxval"] = (
-    maxval)
+  scalarEncoder = networkConfig["sensorRegionConfig"]["encoders"][
+    "scalarEncoder"]
+  fieldName = scalarEncoder["fieldname"]
+  scalarEncoder["minval"] = dataSource.getFieldMin(fieldName)
+  scalarEncoder["maxval"] = dataSource.getFieldMax(fieldName)
 
 
 
@@ -153,8 +140,9 @@ def _addRegisteredRegion(network, regionConfig, moduleName=None):
   if regionTypeName not in _PY_REGIONS:
     registerResearchRegion(regionTypeName, moduleName)
 
-  return network.addRegion(regionName, regionType,
-                           simplejson.dumps(regionParams))
+  # Serialize at call time: createNetwork sets regionParams["inputWidth"] in
+  # place right before this, so a cached encoding could be stale.
+  return network.addRegion(regionName, regionType, json.dumps(regionParams))
 
 
 
@@ -268,10 +256,10 @@ def createNetwork(dataSource, networkConfig, encoder=None):
   previousRegion = sensorRegionName
   previousRegionWidth = sensorRegion.encoder.getWidth()
 
-  networkRegions = [r for r in networkConfig.keys()
-                    if networkConfig[r]["regionEnabled"]]
+  enabledRegions = frozenset(name for name, config in networkConfig.items()
+                             if config.get("regionEnabled"))
 
-  if "spRegionConfig" in networkRegions:
+  if "spRegionConfig" in enabledRegions:
     # create SP region, if enabled
     regionConfig = networkConfig["spRegionConfig"]
     regionName = regionConfig["regionName"]
@@ -286,7 +274,7 @@ def createNetwork(dataSource, networkConfig, encoder=None):
     previousRegion = regionName
     previousRegionWidth = spRegion.getSelf().columnCount
 
-  if "tmRegionConfig" in networkRegions:
+  if "tmRegionConfig" in enabledRegions:
     # create TM region, if enabled
     regionConfig = networkConfig["tmRegionConfig"]
     regionName = regionConfig["regionName"]
@@ -304,7 +292,7 @@ def createNetwork(dataSource, networkConfig, encoder=None):
     previousRegionWidth = (tmRegion.getSelf().columnCount *
                            tmRegion.getSelf().cellsPerColumn)
 
-  if "tpRegionConfig" in networkRegions:
+  if "tpRegionConfig" in enabledRegions:
     # create TP region, if enabled
     regionConfig = networkConfig["tpRegionConfig"]
     regionName = regionConfig["regionName"]
@@ -345,37 +333,22 @@ def createNetwork(dataSource, networkConfig, encoder=None):
 
 
 def setRegionLearning(network, networkConfig, learningMode=True):
-  sensorRegion = network.regions[
-    networkConfig["sensorRegionConfig"].get("regionName")]
+  regions = network.regions
 
-  if networkConfig["spRegionConfig"].get("regionEnabled"):
-    spRegion = network.regions[
-      networkConfig["spRegionConfig"].get("regionName")]
-    spRegion.setParameter("learningMode", learningMode)
-  else:
-    spRegion = None
+  sensorRegion = regions[networkConfig["sensorRegionConfig"]["regionName"]]
 
-  if networkConfig["tmRegionConfig"].get("regionEnabled"):
-    tmRegion = network.regions[
-      networkConfig["tmRegionConfig"].get("regionName")]
-    tmRegion.setParameter("learningMode", learningMode)
-  else:
-    tmRegion = None
+  learningRegions = []
+  for configKey, optional in _LEARNING_REGION_CONFIGS:
+    regionConfig = networkConfig[configKey]
+    if optional and not regionConfig.get("regionEnabled"):
+      learningRegions.append(None)
+      continue
+    region = regions[regionConfig["regionName"]]
+    region.setParameter("learningMode", learningMode)
+    learningRegions.append(region)
 
-  if networkConfig['tpRegionConfig'].get('regionEnabled'):
-    tpRegion = network.regions[
-      networkConfig['tpRegionConfig'].get('regionName')]
-    tpRegion.setParameter("learningMode", learningMode)
-  else:
-    tpRegion = None
+  spRegion, tmRegion, tpRegion, classifierRegion = learningRegions
 
-  classifierRegion = network.regions[
-    networkConfig["classifierRegionConfig"].get("regionName")]
-  classifierRegion.setParameter("learningMode", learningMode)
-
-  if learningMode:
-    _LOGGER.info('Learning is ENABLED.')
-  else:
-    _LOGGER.info('Learning is DISABLED.')
+  _LOGGER.info('Learning is %s.', 'ENABLED' if learningMode else 'DISABLED')
 
   return sensorRegion, spRegion, tmRegion, tpRegion, classifierRegion
@@ -27,7 +27,7 @@ from nupic.engine import Network
 from nupic.engine import pyRegions
 
 # The default NuPIC regions
-_PY_REGIONS = [r[1] for r in pyRegions]
+_PY_REGIONS = set(r[1] for r in pyRegions)
 
 def registerAllResearchRegions():
   """
@@ -60,5 +60,5 @@ def registerResearchRegion(regionTypeName, moduleName=None):
     module = __import__(moduleName, {}, {}, regionTypeName)
     unregisteredClass = getattr(module, regionTypeName)
     Network.registerRegion(unregisteredClass)
-    # Add region to list of registered PyRegions
-    _PY_REGIONS.append(regionTypeName)
+    # Add region to set of registered PyRegions
+    _PY_REGIONS.add(regionTypeName)
@@ -26,6 +26,7 @@ import json
 import numpy as np
 import simplejson
 import os
+import sys
 
 from nupic.data.file_record_stream import FileRecordStream
 
@@ -400,4 +401,6 @@ def run(network,
 
 
 if __name__ == '__main__':
+  logging.basicConfig(format='[%(levelname)s] %(message)s',
+                      level=logging.DEBUG, stream=sys.stdout)
   main()